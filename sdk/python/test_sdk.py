@@ -13,18 +13,26 @@ Usage:
     python test_sdk.py -v
 """
 
+import atexit
 import base64
+import functools
+import io
+import itertools
 import json
 import os
 import sys
 import tempfile
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 from typing import Optional
 
 # Import SDK from same directory
 sys.path.insert(0, os.path.dirname(__file__))
+import qr_service
 from qr_service import (
+    AsyncQRService,
     GoneError,
     NotFoundError,
     QRService,
@@ -34,8 +42,110 @@ from qr_service import (
     ValidationError,
 )
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 BASE_URL = os.environ.get("QR_SERVICE_URL", "http://localhost:3001")
 
+# Hoisted assertion literals — these checks run across many tests (and in
+# per-item batch loops), so build each prefix/magic once. Compared with
+# startswith() (no slice allocation); SVG uses a bounded find() since the
+# tag may sit after an XML prolog but never past the first few hundred bytes.
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+_PDF_MAGIC = b"%PDF"
+
+# Minimal 1x1 red PNG, shared by every logo test. Built once so batch
+# loops and fan-out tests don't re-concatenate the data URI.
+_TINY_LOGO_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQV"
+    "R42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+)
+_TINY_LOGO_URI = f"data:image/png;base64,{_TINY_LOGO_B64}"
+_SVG_OPEN = b"<svg"
+_PNG_DATA_URI = "data:image/png;base64,"
+_SVG_DATA_URI = "data:image/svg+xml;base64,"
+_PDF_DATA_URI = "data:application/pdf;base64,"
+_DATA_URIS = {"png": _PNG_DATA_URI, "svg": _SVG_DATA_URI, "pdf": _PDF_DATA_URI}
+
+# One client for the whole suite so every test reuses its connection pool
+# instead of paying TCP (+TLS) setup per class. Closed at interpreter exit
+# rather than in tearDownModule, which the parallel runner would fire once
+# per class suite. Safe to share across runner threads — the underlying
+# pools are thread-safe.
+_SHARED_QR = QRService(BASE_URL)
+atexit.register(_SHARED_QR.close)
+
+# Bind the module-level client() singleton before any test runs:
+# TestConstructor mutates QR_SERVICE_URL while other classes run in
+# parallel, and a lazy first use from TestModuleClient could capture
+# the patched value for the rest of the run.
+qr_service.client()
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_generate(data: str, opts: tuple) -> dict:
+    return _SHARED_QR.generate(data, **dict(opts))
+
+
+def _decode_data(raw: bytes) -> str:
+    """Decode QR content from raw image bytes, locally when possible.
+
+    With the pyzbar + Pillow dev extras installed, roundtrip assertions
+    decode in-process and skip the second server hop. Otherwise (or when
+    the image defeats zbar) this falls back to the /qr/decode endpoint,
+    which TestDecode.test_decode_roundtrip still covers as the contract
+    check regardless.
+    """
+    try:
+        from PIL import Image
+        from pyzbar.pyzbar import decode as zbar_decode
+
+        return zbar_decode(Image.open(io.BytesIO(raw)))[0].data.decode()
+    except Exception:
+        return _SHARED_QR.decode(raw)["data"]
+
+
+@functools.lru_cache(maxsize=1)
+def _provoked_not_found() -> Optional[QRServiceError]:
+    """The error raised by probing an unknown tracked id, fetched once.
+
+    Module-level because TestExceptions and TestErrorResponses both
+    inspect the same 404 and run as separate classes under the parallel
+    runner; lazy so serial single-test runs don't pay the round-trip.
+    Returns None if the probe unexpectedly succeeds.
+    """
+    try:
+        _SHARED_QR.tracked_stats("nonexistent", "fake")
+    except QRServiceError as e:
+        return e
+    return None
+
+
+_CODE_COUNTER = itertools.count()
+
+
+def _uniq_code(prefix: str = "test") -> str:
+    """Process-unique short code.
+
+    A pid + counter + monotonic-ns suffix can't collide across parallel
+    runner threads or rapid reruns, unlike the old ``int(time.time())``
+    stamp with its one-second resolution.
+    """
+    return f"{prefix}-{os.getpid()}-{next(_CODE_COUNTER)}-{time.monotonic_ns()}"
+
+
+def gen(data: str, **kw) -> dict:
+    """Cached generate for fixture images.
+
+    Generation is deterministic (TestGenerateDeterminism), so tests that
+    only need *an* image for downstream decode/save assertions share one
+    response instead of re-issuing identical requests. Tests that assert
+    on generation itself keep calling ``self.qr.generate`` directly.
+    """
+    return _cached_generate(data, tuple(sorted(kw.items())))
+
 
 class QRServiceTestCase(unittest.TestCase):
     """Base class with shared setup."""
@@ -45,22 +155,45 @@ class QRServiceTestCase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.qr = QRService(BASE_URL)
+        cls.qr = _SHARED_QR
         cls._tracked_ids = []
 
     @classmethod
     def tearDownClass(cls) -> None:
-        for tid, token in cls._tracked_ids:
-            try:
-                cls.qr.delete_tracked(tid, token)
-            except Exception:
-                pass
+        if not cls._tracked_ids:
+            return
+        # Deletes are independent — fire them together instead of paying
+        # one round-trip each at teardown.
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(cls._silent_delete, cls._tracked_ids))
+
+    @classmethod
+    def _silent_delete(cls, pair: tuple) -> None:
+        try:
+            cls.qr.delete_tracked(*pair)
+        except Exception:
+            pass
 
     def _track(self, result: dict) -> dict:
         """Register a tracked QR for cleanup."""
         self.__class__._tracked_ids.append((result["id"], result["manage_token"]))
         return result
 
+    def _roundtrip_data(self, result: dict) -> str:
+        """Decoded content of a generate/template response.
+
+        Goes through _decode_data, so with the dev extras installed the
+        roundtrip costs one HTTP call (the generate) instead of two.
+        """
+        return _decode_data(self.qr.image_bytes(result))
+
+    def _assert_data_uri(self, b64: str, fmt: str) -> None:
+        """Assert a data URI carries the expected format's MIME prefix."""
+        self.assertTrue(
+            b64.startswith(_DATA_URIS[fmt]),
+            f"expected {fmt} data URI, got {b64[:40]!r}",
+        )
+
 
 # =========================================================================
 # Health
@@ -78,8 +211,12 @@ class TestHealth(QRServiceTestCase):
         self.assertTrue(self.qr.is_healthy())
 
     def test_is_healthy_bad_url(self):
-        bad = QRService("http://localhost:1")
+        # Sub-second timeout so a dropped (rather than refused) connection
+        # can't stall the test for the kernel's SYN-retry window.
+        bad = QRService("http://localhost:1", timeout=0.25)
+        t0 = time.perf_counter()
         self.assertFalse(bad.is_healthy())
+        self.assertLess(time.perf_counter() - t0, 1.0)
 
     def test_health_uptime_positive(self):
         h = self.qr.health()
@@ -99,7 +236,7 @@ class TestHealth(QRServiceTestCase):
 class TestGenerate(QRServiceTestCase):
     def test_generate_png(self):
         result = self.qr.generate("https://example.com")
-        self.assertTrue(result["image_base64"].startswith("data:image/png;base64,"))
+        self._assert_data_uri(result["image_base64"], "png")
         self.assertEqual(result["format"], "png")
         self.assertEqual(result["size"], 256)
         self.assertEqual(result["data"], "https://example.com")
@@ -107,12 +244,12 @@ class TestGenerate(QRServiceTestCase):
 
     def test_generate_svg(self):
         result = self.qr.generate("hello world", format="svg")
-        self.assertTrue(result["image_base64"].startswith("data:image/svg+xml;base64,"))
+        self._assert_data_uri(result["image_base64"], "svg")
         self.assertEqual(result["format"], "svg")
 
     def test_generate_pdf(self):
         result = self.qr.generate("pdf test", format="pdf")
-        self.assertTrue(result["image_base64"].startswith("data:application/pdf;base64,"))
+        self._assert_data_uri(result["image_base64"], "pdf")
         self.assertEqual(result["format"], "pdf")
 
     def test_generate_custom_size(self):
@@ -124,14 +261,23 @@ class TestGenerate(QRServiceTestCase):
         self.assertIsNotNone(result["image_base64"])
 
     def test_generate_all_styles(self):
-        for style in ("square", "rounded", "dots"):
-            result = self.qr.generate(f"style-{style}", style=style)
-            self.assertIsNotNone(result["image_base64"])
+        # One batch round-trip instead of one request per style.
+        styles = ("square", "rounded", "dots")
+        result = self.qr.batch([{"data": f"style-{s}", "style": s} for s in styles])
+        for style, item in zip(styles, result["items"]):
+            with self.subTest(style=style):
+                self.assertIsNotNone(item["image_base64"])
+                self.assertEqual(item["data"], f"style-{style}")
 
     def test_generate_all_ec_levels(self):
-        for ec in ("L", "M", "Q", "H"):
-            result = self.qr.generate(f"ec-{ec}", error_correction=ec)
-            self.assertIsNotNone(result["image_base64"])
+        levels = ("L", "M", "Q", "H")
+        result = self.qr.batch(
+            [{"data": f"ec-{ec}", "error_correction": ec} for ec in levels]
+        )
+        for ec, item in zip(levels, result["items"]):
+            with self.subTest(error_correction=ec):
+                self.assertIsNotNone(item["image_base64"])
+                self.assertEqual(item["data"], f"ec-{ec}")
 
     def test_generate_empty_data_rejected(self):
         with self.assertRaises(ValidationError) as ctx:
@@ -150,6 +296,16 @@ class TestGenerate(QRServiceTestCase):
         with self.assertRaises(ValidationError):
             self.qr.generate("bad", format="gif")
 
+    def test_generate_invalid_ec_rejected_locally(self):
+        with self.assertRaises(ValidationError) as ctx:
+            self.qr.generate("bad-ec", error_correction="X")
+        self.assertEqual(ctx.exception.status_code, 0)
+
+    def test_generate_invalid_style_rejected_locally(self):
+        with self.assertRaises(ValidationError) as ctx:
+            self.qr.generate("bad-style", style="hexagon")
+        self.assertEqual(ctx.exception.status_code, 0)
+
     def test_convenience_generate_png(self):
         result = self.qr.generate_png("convenience png")
         self.assertEqual(result["format"], "png")
@@ -191,54 +347,45 @@ class TestGenerateRoundtrip(QRServiceTestCase):
 
     def test_roundtrip_square_png(self):
         result = self.qr.generate("rt-square", style="square")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
+        decoded = self.qr.decode_data_uri(result["image_base64"])
         self.assertEqual(decoded["data"], "rt-square")
 
     def test_roundtrip_rounded_generates(self):
         """Rounded style generates successfully (decode not reliable with rqrr)."""
         result = self.qr.generate("rt-rounded", style="rounded")
         raw = self.qr.image_bytes(result)
-        self.assertTrue(raw[:4] == b"\x89PNG")
+        self.assertTrue(raw.startswith(_PNG_MAGIC))
         self.assertTrue(len(raw) > 100)
 
     def test_roundtrip_dots_generates(self):
         """Dots style generates successfully (decode not reliable with rqrr)."""
         result = self.qr.generate("rt-dots", style="dots")
         raw = self.qr.image_bytes(result)
-        self.assertTrue(raw[:4] == b"\x89PNG")
+        self.assertTrue(raw.startswith(_PNG_MAGIC))
         self.assertTrue(len(raw) > 100)
 
     def test_roundtrip_svg_valid(self):
         """SVG output should be valid SVG markup."""
         result = self.qr.generate("svg-content", format="svg")
         raw = self.qr.image_bytes(result)
-        self.assertIn(b"<svg", raw)
+        self.assertNotEqual(raw.find(_SVG_OPEN, 0, 512), -1)
         self.assertIn(b"</svg>", raw)
 
-    def test_roundtrip_custom_colors(self):
-        result = self.qr.generate("colored-rt", fg_color="#0000FF", bg_color="#FFFF00")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "colored-rt")
-
-    def test_roundtrip_large_size(self):
-        result = self.qr.generate("large-rt", size=512)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "large-rt")
-
-    def test_roundtrip_small_size(self):
-        result = self.qr.generate("small-rt", size=64)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "small-rt")
-
-    def test_roundtrip_ec_low(self):
-        result = self.qr.generate("ec-L-rt", error_correction="L")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "ec-L-rt")
-
-    def test_roundtrip_ec_high(self):
-        result = self.qr.generate("ec-H-rt", error_correction="H")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "ec-H-rt")
+    def test_roundtrip_variants(self):
+        """Colors, sizes, and EC levels: one batch generate, then decode each."""
+        variants = [
+            {"data": "colored-rt", "fg_color": "#0000FF", "bg_color": "#FFFF00"},
+            {"data": "large-rt", "size": 512},
+            {"data": "small-rt", "size": 64},
+            {"data": "ec-L-rt", "error_correction": "L"},
+            {"data": "ec-H-rt", "error_correction": "H"},
+        ]
+        result = self.qr.batch(variants)
+        for spec, item in zip(variants, result["items"]):
+            with self.subTest(**spec):
+                self.assertEqual(
+                    _decode_data(self.qr.image_bytes(item)), spec["data"],
+                )
 
 
 # =========================================================================
@@ -249,15 +396,17 @@ class TestGenerateRoundtrip(QRServiceTestCase):
 class TestGenerateDeterminism(QRServiceTestCase):
     """Same parameters should produce identical output."""
 
-    def test_deterministic_png(self):
-        r1 = self.qr.generate("determ", size=128, style="square")
-        r2 = self.qr.generate("determ", size=128, style="square")
-        self.assertEqual(r1["image_base64"], r2["image_base64"])
-
-    def test_deterministic_svg(self):
-        r1 = self.qr.generate("determ-svg", format="svg", style="dots")
-        r2 = self.qr.generate("determ-svg", format="svg", style="dots")
-        self.assertEqual(r1["image_base64"], r2["image_base64"])
+    def test_deterministic_output(self):
+        # subTest is unittest's parametrize: one method, per-variant report.
+        cases = [
+            {"data": "determ", "size": 128, "style": "square"},
+            {"data": "determ-svg", "format": "svg", "style": "dots"},
+        ]
+        for spec in cases:
+            with self.subTest(**spec):
+                r1 = self.qr.generate(**spec)
+                r2 = self.qr.generate(**spec)
+                self.assertEqual(r1["image_base64"], r2["image_base64"])
 
     def test_different_data_different_output(self):
         r1 = self.qr.generate("data-a")
@@ -274,6 +423,39 @@ class TestGenerateDeterminism(QRServiceTestCase):
         r2 = self.qr.generate("size-diff", size=512)
         self.assertNotEqual(r1["image_base64"], r2["image_base64"])
 
+    def test_generate_cache_opt_in(self):
+        r1 = self.qr.generate("cache-me", size=128, cache=True)
+        r2 = self.qr.generate("cache-me", size=128, cache=True)
+        self.assertIs(r1, r2)
+        self.qr.clear_cache()
+        r3 = self.qr.generate("cache-me", size=128, cache=True)
+        self.assertIsNot(r1, r3)
+        self.assertEqual(r1["image_base64"], r3["image_base64"])
+
+    def test_generate_no_cache_by_default(self):
+        r1 = self.qr.generate("no-cache")
+        r2 = self.qr.generate("no-cache")
+        self.assertIsNot(r1, r2)
+
+    def test_generate_disk_cache_env(self):
+        """QR_SDK_CACHE_DIR persists generate() responses across clients."""
+        with tempfile.TemporaryDirectory() as d:
+            os.environ["QR_SDK_CACHE_DIR"] = d
+            try:
+                r1 = QRService(BASE_URL).generate("disk-cache-test")
+                # Concurrent tests may cache their own entries here while
+                # the env var is set — only count ours.
+                ours = [
+                    name for name in os.listdir(d)
+                    if "disk-cache-test" in open(os.path.join(d, name)).read()
+                ]
+                self.assertEqual(len(ours), 1)
+                # A fresh client hits the disk entry, not the server.
+                r2 = QRService(BASE_URL).generate("disk-cache-test")
+            finally:
+                del os.environ["QR_SDK_CACHE_DIR"]
+            self.assertEqual(r1, r2)
+
 
 # =========================================================================
 # Generate — Logo Overlay
@@ -283,11 +465,7 @@ class TestGenerateDeterminism(QRServiceTestCase):
 class TestGenerateLogo(QRServiceTestCase):
     """Test logo overlay functionality."""
 
-    # Minimal 1x1 red PNG (base64)
-    TINY_PNG = (
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQV"
-        "R42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
-    )
+    TINY_PNG = _TINY_LOGO_URI
 
     def test_logo_png(self):
         result = self.qr.generate("logo-test", logo=self.TINY_PNG)
@@ -297,7 +475,7 @@ class TestGenerateLogo(QRServiceTestCase):
     def test_logo_svg(self):
         result = self.qr.generate("logo-svg", format="svg", logo=self.TINY_PNG)
         raw = self.qr.image_bytes(result)
-        self.assertIn(b"<svg", raw)
+        self.assertNotEqual(raw.find(_SVG_OPEN, 0, 512), -1)
 
     def test_logo_custom_size(self):
         result = self.qr.generate("logo-size", logo=self.TINY_PNG, logo_size=30)
@@ -326,11 +504,19 @@ class TestGenerateLogo(QRServiceTestCase):
         self.assertEqual(decoded["data"], "logo-rt")
 
     def test_logo_with_all_styles(self):
-        for style in ("square", "rounded", "dots"):
-            result = self.qr.generate(
-                f"logo-{style}", style=style, logo=self.TINY_PNG
-            )
-            self.assertIsNotNone(result["image_base64"])
+        # Fire the three variants concurrently — logo requests aren't
+        # batchable, but they are independent.
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            futs = {
+                style: ex.submit(
+                    self.qr.generate, f"logo-{style}", style=style,
+                    logo=self.TINY_PNG,
+                )
+                for style in ("square", "rounded", "dots")
+            }
+            for style, fut in futs.items():
+                with self.subTest(style=style):
+                    self.assertIsNotNone(fut.result()["image_base64"])
 
 
 # =========================================================================
@@ -341,9 +527,8 @@ class TestGenerateLogo(QRServiceTestCase):
 class TestDecode(QRServiceTestCase):
     def test_decode_roundtrip(self):
         """Generate a PNG, then decode it — content should match."""
-        result = self.qr.generate("roundtrip test")
-        raw = self.qr.image_bytes(result)
-        decoded = self.qr.decode(raw)
+        result = gen("roundtrip test")
+        decoded = self.qr.decode_data_uri(result["image_base64"])
         self.assertEqual(decoded["data"], "roundtrip test")
         self.assertEqual(decoded["format"], "qr")
 
@@ -356,7 +541,7 @@ class TestDecode(QRServiceTestCase):
             self.qr.decode(b"")
 
     def test_decode_returns_format_field(self):
-        result = self.qr.generate("fmt-check")
+        result = gen("fmt-check")
         decoded = self.qr.decode(self.qr.image_bytes(result))
         self.assertIn("format", decoded)
         self.assertIn("data", decoded)
@@ -364,13 +549,13 @@ class TestDecode(QRServiceTestCase):
     def test_decode_unicode_content(self):
         original = "日本語テスト 🎯"
         result = self.qr.generate(original)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
+        decoded = self.qr.decode_data_uri(result["image_base64"])
         self.assertEqual(decoded["data"], original)
 
     def test_decode_url_content(self):
         url = "https://example.com/path?key=value&foo=bar#anchor"
         result = self.qr.generate(url)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
+        decoded = self.qr.decode_data_uri(result["image_base64"])
         self.assertEqual(decoded["data"], url)
 
 
@@ -451,12 +636,8 @@ class TestBatch(QRServiceTestCase):
         )
 
     def test_batch_with_logo(self):
-        tiny = (
-            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQV"
-            "R42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
-        )
         result = self.qr.batch([
-            {"data": "logo-batch", "logo": f"data:image/png;base64,{tiny}"},
+            {"data": "logo-batch", "logo": _TINY_LOGO_URI},
         ])
         self.assertEqual(result["total"], 1)
         self.assertIsNotNone(result["items"][0]["image_base64"])
@@ -475,6 +656,31 @@ class TestBatch(QRServiceTestCase):
         result = self.qr.batch([{"data": "share-batch"}])
         self.assertIn("share_url", result["items"][0])
 
+    def test_generate_many(self):
+        results = self.qr.generate_many([f"many-{i}" for i in range(5)])
+        self.assertEqual(len(results), 5)
+        for i, item in enumerate(results):
+            self.assertEqual(item["data"], f"many-{i}")
+
+    def test_generate_many_chunks_over_batch_limit(self):
+        """More than 50 items should be split across multiple batch calls."""
+        results = self.qr.generate_many([f"chunked-{i}" for i in range(60)])
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[59]["data"], "chunked-59")
+
+    def test_generate_many_concurrent(self):
+        results = self.qr.generate_many(
+            [f"conc-{i}" for i in range(60)], chunk=20, concurrent=True
+        )
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[0]["data"], "conc-0")
+        self.assertEqual(results[59]["data"], "conc-59")
+
+    def test_generate_many_with_opts(self):
+        results = self.qr.generate_many(["opt-a", "opt-b"], format="svg")
+        for item in results:
+            self.assertEqual(item["format"], "svg")
+
     def test_batch_decode_roundtrip(self):
         """Batch-generate, then decode each — verify content."""
         items = [{"data": f"batch-rt-{i}"} for i in range(3)]
@@ -506,7 +712,7 @@ class TestTemplates(QRServiceTestCase):
 
     def test_wifi_svg_format(self):
         result = self.qr.wifi("SvgNet", "pass", format="svg")
-        self.assertTrue(result["image_base64"].startswith("data:image/svg+xml"))
+        self._assert_data_uri(result["image_base64"], "svg")
 
     def test_wifi_custom_style(self):
         result = self.qr.wifi("StyledNet", "pass", style="dots")
@@ -526,12 +732,18 @@ class TestTemplates(QRServiceTestCase):
 
     def test_wifi_pdf_format(self):
         result = self.qr.wifi("PdfWifi", "pass", format="pdf")
-        self.assertTrue(result["image_base64"].startswith("data:application/pdf"))
+        self._assert_data_uri(result["image_base64"], "pdf")
 
     def test_wifi_decode_roundtrip(self):
         result = self.qr.wifi("RtWifi", "rtpass")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertIn("RtWifi", decoded["data"])
+        self.assertIn("RtWifi", self._roundtrip_data(result))
+
+    def test_template_cache_opt_in(self):
+        r1 = self.qr.wifi("CachedNet", "pass", cache=True)
+        r2 = self.qr.wifi("CachedNet", "pass", cache=True)
+        self.assertIs(r1, r2)
+        r3 = self.qr.wifi("CachedNet", "pass")
+        self.assertIsNot(r1, r3)
 
     def test_vcard_minimal(self):
         result = self.qr.vcard("Alice")
@@ -561,17 +773,17 @@ class TestTemplates(QRServiceTestCase):
 
     def test_vcard_svg_format(self):
         result = self.qr.vcard("SvgCard", format="svg")
-        self.assertTrue(result["image_base64"].startswith("data:image/svg+xml"))
+        self._assert_data_uri(result["image_base64"], "svg")
 
     def test_vcard_pdf_format(self):
         result = self.qr.vcard("PdfCard", format="pdf")
-        self.assertTrue(result["image_base64"].startswith("data:application/pdf"))
+        self._assert_data_uri(result["image_base64"], "pdf")
 
     def test_vcard_decode_roundtrip(self):
         result = self.qr.vcard("Roundtrip Person", email="rt@test.com")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertIn("Roundtrip Person", decoded["data"])
-        self.assertIn("rt@test.com", decoded["data"])
+        decoded = self._roundtrip_data(result)
+        self.assertIn("Roundtrip Person", decoded)
+        self.assertIn("rt@test.com", decoded)
 
     def test_url_simple(self):
         result = self.qr.url("https://example.com")
@@ -595,7 +807,7 @@ class TestTemplates(QRServiceTestCase):
 
     def test_url_svg_format(self):
         result = self.qr.url("https://example.com", format="svg")
-        self.assertTrue(result["image_base64"].startswith("data:image/svg+xml"))
+        self._assert_data_uri(result["image_base64"], "svg")
 
     def test_url_custom_style(self):
         result = self.qr.url("https://example.com", style="rounded")
@@ -603,8 +815,9 @@ class TestTemplates(QRServiceTestCase):
 
     def test_url_decode_roundtrip(self):
         result = self.qr.url("https://roundtrip.example.com")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "https://roundtrip.example.com")
+        self.assertEqual(
+            self._roundtrip_data(result), "https://roundtrip.example.com",
+        )
 
     def test_unknown_template_rejected(self):
         with self.assertRaises(ValidationError):
@@ -616,27 +829,44 @@ class TestTemplates(QRServiceTestCase):
 # =========================================================================
 
 
+#: Contract fields of a tracked-QR creation response.
+_TRACKED_FIELDS = frozenset({
+    "id", "qr_id", "short_code", "short_url", "target_url",
+    "manage_token", "manage_url", "scan_count", "created_at", "qr",
+})
+
+
 class TestTracked(QRServiceTestCase):
+    _shared: dict
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One tracked QR for the schema-shape tests; creating per test
+        # costs a server-side render + insert each time.
+        super().setUpClass()
+        cls._shared = cls.qr.create_tracked("https://example.com")
+        cls._tracked_ids.append((cls._shared["id"], cls._shared["manage_token"]))
+
     def test_create_tracked(self):
-        result = self._track(self.qr.create_tracked("https://example.com"))
-        self.assertIn("id", result)
-        self.assertIn("manage_token", result)
-        self.assertIn("short_url", result)
-        self.assertIn("short_code", result)
-        self.assertIn("target_url", result)
+        result = self._shared
+        # One set difference instead of an assertIn per field; the full
+        # field inventory lives in test_tracked_response_fields.
+        missing = {
+            "id", "manage_token", "short_url", "short_code", "target_url", "qr",
+        } - result.keys()
+        self.assertFalse(missing, f"Missing fields: {sorted(missing)}")
         self.assertEqual(result["target_url"], "https://example.com")
         self.assertEqual(result["scan_count"], 0)
-        self.assertIn("qr", result)
         self.assertIn("image_base64", result["qr"])
 
     def test_create_tracked_custom_short_code(self):
-        code = f"test-{int(time.time())}"
+        code = _uniq_code()
         result = self._track(self.qr.create_tracked("https://example.com", short_code=code))
         self.assertEqual(result["short_code"], code)
 
     def test_create_tracked_svg(self):
         result = self._track(self.qr.create_tracked("https://example.com", format="svg"))
-        self.assertTrue(result["qr"]["image_base64"].startswith("data:image/svg+xml"))
+        self._assert_data_uri(result["qr"]["image_base64"], "svg")
 
     def test_tracked_stats(self):
         created = self._track(self.qr.create_tracked("https://stats.example.com"))
@@ -683,17 +913,12 @@ class TestTracked(QRServiceTestCase):
 
     def test_tracked_response_fields(self):
         """Verify all expected fields in tracked QR response."""
-        result = self._track(self.qr.create_tracked("https://fields.example.com"))
-        expected_fields = [
-            "id", "qr_id", "short_code", "short_url", "target_url",
-            "manage_token", "manage_url", "scan_count", "created_at", "qr",
-        ]
-        for field in expected_fields:
-            self.assertIn(field, result, f"Missing field: {field}")
+        missing = _TRACKED_FIELDS - self._shared.keys()
+        self.assertFalse(missing, f"Missing fields: {sorted(missing)}")
 
     def test_create_tracked_pdf(self):
         result = self._track(self.qr.create_tracked("https://pdf.example.com", format="pdf"))
-        self.assertTrue(result["qr"]["image_base64"].startswith("data:application/pdf"))
+        self._assert_data_uri(result["qr"]["image_base64"], "pdf")
 
     def test_create_tracked_custom_style(self):
         result = self._track(
@@ -744,19 +969,18 @@ class TestTracked(QRServiceTestCase):
 
     def test_create_tracked_short_code_uniqueness(self):
         """Two tracked QRs with different short codes should coexist."""
-        ts = int(time.time())
         r1 = self._track(
-            self.qr.create_tracked("https://a.example.com", short_code=f"uniq-a-{ts}")
+            self.qr.create_tracked("https://a.example.com", short_code=_uniq_code("uniq-a"))
         )
         r2 = self._track(
-            self.qr.create_tracked("https://b.example.com", short_code=f"uniq-b-{ts}")
+            self.qr.create_tracked("https://b.example.com", short_code=_uniq_code("uniq-b"))
         )
         self.assertNotEqual(r1["short_code"], r2["short_code"])
         self.assertNotEqual(r1["id"], r2["id"])
 
     def test_create_tracked_duplicate_short_code_rejected(self):
         """Duplicate short codes should be rejected."""
-        code = f"dup-{int(time.time())}"
+        code = _uniq_code("dup")
         self._track(self.qr.create_tracked("https://first.example.com", short_code=code))
         with self.assertRaises(QRServiceError):
             self.qr.create_tracked("https://second.example.com", short_code=code)
@@ -781,14 +1005,17 @@ class TestTracked(QRServiceTestCase):
 
 
 class TestView(QRServiceTestCase):
+    # Shape-only smoke tests request the minimum size the server accepts
+    # (64px) so they don't pay render time and bandwidth for a default
+    # 256px image they never inspect. Tests that vary size keep their own.
     def test_view_basic(self):
         """View endpoint should return HTML or an image."""
-        result = self.qr.view("https://view-test.example.com")
+        result = self.qr.view("https://view-test.example.com", size=64)
         self.assertIsNotNone(result)
         self.assertIsInstance(result, bytes)
 
     def test_view_with_style(self):
-        result = self.qr.view("view-style", style="dots")
+        result = self.qr.view("view-style", style="dots", size=64)
         self.assertIsNotNone(result)
 
     def test_view_with_size(self):
@@ -796,7 +1023,7 @@ class TestView(QRServiceTestCase):
         self.assertIsNotNone(result)
 
     def test_view_with_colors(self):
-        result = self.qr.view("view-colors", fg="#FF0000", bg="#00FF00")
+        result = self.qr.view("view-colors", fg="#FF0000", bg="#00FF00", size=64)
         self.assertIsNotNone(result)
 
     def test_view_with_format(self):
@@ -810,6 +1037,25 @@ class TestView(QRServiceTestCase):
 
 
 class TestDiscovery(QRServiceTestCase):
+    """Discovery endpoints.
+
+    The shared client memoizes these per instance (see
+    QRService._discovery), so the repeated openapi()/llms_txt() calls
+    below cost one fetch per endpoint for the whole run — no class-level
+    caching needed here. The OpenAPI spec is still pinned in setUpClass
+    with its path set precomputed, so the spec assertions don't rescan
+    the paths dict.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._openapi = cls.qr.openapi()
+        cls._openapi_paths = frozenset(cls._openapi.get("paths", {}))
+        cls._openapi_has_generate = any(
+            "generate" in p for p in cls._openapi_paths
+        )
+
     def test_llms_txt(self):
         txt = self.qr.llms_txt()
         self.assertIsInstance(txt, str)
@@ -827,20 +1073,21 @@ class TestDiscovery(QRServiceTestCase):
         self.assertEqual(root, api)
 
     def test_openapi(self):
-        spec = self.qr.openapi()
-        self.assertIn("openapi", spec)
-        self.assertIn("paths", spec)
+        self.assertIn("openapi", self._openapi)
+        self.assertIn("paths", self._openapi)
+
+    def test_discovery_memoized(self):
+        """Discovery docs are static per server version — fetched once."""
+        self.assertIs(self.qr.openapi(), self.qr.openapi())
 
     def test_openapi_has_info(self):
-        spec = self.qr.openapi()
-        self.assertIn("info", spec)
-        self.assertIn("title", spec["info"])
+        self.assertIn("info", self._openapi)
+        self.assertIn("title", self._openapi["info"])
 
     def test_openapi_has_generate_path(self):
-        spec = self.qr.openapi()
-        paths = spec.get("paths", {})
-        has_generate = any("generate" in p for p in paths)
-        self.assertTrue(has_generate, "OpenAPI should document /qr/generate")
+        self.assertTrue(
+            self._openapi_has_generate, "OpenAPI should document /qr/generate"
+        )
 
     def test_skills_index(self):
         idx = self.qr.skills()
@@ -874,76 +1121,69 @@ class TestDiscovery(QRServiceTestCase):
 
 class TestHelpers(QRServiceTestCase):
     def test_image_bytes(self):
-        result = self.qr.generate("bytes test")
+        result = gen("bytes test")
         raw = self.qr.image_bytes(result)
         self.assertIsInstance(raw, bytes)
         self.assertTrue(len(raw) > 100)
         # PNG magic bytes
-        self.assertTrue(raw[:4] == b"\x89PNG")
+        self.assertTrue(raw.startswith(_PNG_MAGIC))
 
     def test_image_bytes_svg(self):
         result = self.qr.generate_svg("svg bytes")
         raw = self.qr.image_bytes(result)
-        self.assertIn(b"<svg", raw)
+        self.assertNotEqual(raw.find(_SVG_OPEN, 0, 512), -1)
 
     def test_image_bytes_pdf(self):
         result = self.qr.generate_pdf("pdf bytes")
         raw = self.qr.image_bytes(result)
-        self.assertTrue(raw[:4] == b"%PDF")
+        self.assertTrue(raw.startswith(_PDF_MAGIC))
 
     def test_save_qr(self):
-        result = self.qr.generate("save test")
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
-        try:
+        # Keeps the on-disk path covered; TemporaryDirectory bulk-removes,
+        # so no unlink bookkeeping.
+        result = gen("save test")
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "q.png")
             self.qr.save_qr(result, path)
             with open(path, "rb") as f:
                 data = f.read()
-            self.assertTrue(data[:4] == b"\x89PNG")
-            self.assertTrue(len(data) > 100)
-        finally:
-            os.unlink(path)
+        self.assertTrue(data.startswith(_PNG_MAGIC))
+        self.assertTrue(len(data) > 100)
+
+    def test_save_qr_to_path_all_formats(self):
+        """On-disk regression coverage for each format; the rest of the
+        save tests stay in-memory."""
+        checks = {
+            "png": lambda data: data.startswith(_PNG_MAGIC),
+            "svg": lambda data: data.find(_SVG_OPEN, 0, 512) != -1,
+            "pdf": lambda data: data.startswith(_PDF_MAGIC),
+        }
+        with tempfile.TemporaryDirectory() as d:
+            for fmt, ok in checks.items():
+                with self.subTest(format=fmt):
+                    path = os.path.join(d, f"q.{fmt}")
+                    self.qr.save_qr(gen(f"save path {fmt}", format=fmt), path)
+                    with open(path, "rb") as f:
+                        self.assertTrue(ok(f.read()))
 
     def test_save_qr_svg(self):
         result = self.qr.generate_svg("save svg")
-        with tempfile.NamedTemporaryFile(suffix=".svg", delete=False) as f:
-            path = f.name
-        try:
-            self.qr.save_qr(result, path)
-            with open(path, "rb") as f:
-                data = f.read()
-            self.assertIn(b"<svg", data)
-        finally:
-            os.unlink(path)
+        buf = io.BytesIO()
+        self.qr.save_qr(result, buf)
+        self.assertNotEqual(buf.getvalue().find(_SVG_OPEN, 0, 512), -1)
 
     def test_save_qr_pdf(self):
         result = self.qr.generate_pdf("save pdf")
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            path = f.name
-        try:
-            self.qr.save_qr(result, path)
-            with open(path, "rb") as f:
-                data = f.read()
-            self.assertTrue(data[:4] == b"%PDF")
-        finally:
-            os.unlink(path)
+        buf = io.BytesIO()
+        self.qr.save_qr(result, buf)
+        self.assertTrue(buf.getvalue().startswith(_PDF_MAGIC))
 
     def test_decode_from_saved(self):
-        """Full roundtrip: generate → save → read → decode."""
-        result = self.qr.generate("full roundtrip")
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
-        try:
-            self.qr.save_qr(result, path)
-            with open(path, "rb") as f:
-                raw = f.read()
-            decoded = self.qr.decode(raw)
-            self.assertEqual(decoded["data"], "full roundtrip")
-        finally:
-            os.unlink(path)
-
-    def test_repr(self):
-        self.assertIn(BASE_URL, repr(self.qr))
+        """Full roundtrip: generate → save → read back → decode."""
+        result = gen("full roundtrip")
+        buf = io.BytesIO()
+        self.qr.save_qr(result, buf)
+        self.assertEqual(_decode_data(buf.getvalue()), "full roundtrip")
 
 
 # =========================================================================
@@ -952,18 +1192,14 @@ class TestHelpers(QRServiceTestCase):
 
 
 class TestConstructor(QRServiceTestCase):
+    def test_repr(self):
+        """repr carries the base URL — a construction-time invariant."""
+        self.assertIn(BASE_URL, repr(self.qr))
+
     def test_env_config(self):
         """QRService reads QR_SERVICE_URL from environment."""
-        original = os.environ.get("QR_SERVICE_URL")
-        try:
-            os.environ["QR_SERVICE_URL"] = "http://custom:9999"
-            client = QRService()
-            self.assertEqual(client.base_url, "http://custom:9999")
-        finally:
-            if original:
-                os.environ["QR_SERVICE_URL"] = original
-            else:
-                os.environ.pop("QR_SERVICE_URL", None)
+        with mock.patch.dict(os.environ, {"QR_SERVICE_URL": "http://custom:9999"}):
+            self.assertEqual(QRService().base_url, "http://custom:9999")
 
     def test_trailing_slash_stripped(self):
         client = QRService("http://localhost:3001/")
@@ -1000,12 +1236,44 @@ class TestConstructor(QRServiceTestCase):
                 os.environ.pop("QR_SERVICE_URL", None)
 
 
+# =========================================================================
+# Module-level default client
+# =========================================================================
+
+
+class TestModuleClient(QRServiceTestCase):
+    def test_client_is_singleton(self):
+        self.assertIs(qr_service.client(), qr_service.client())
+
+    def test_client_reads_env(self):
+        self.assertEqual(qr_service.client().base_url, BASE_URL)
+
+    def test_module_level_generate(self):
+        result = qr_service.generate("module-level")
+        self.assertEqual(result["data"], "module-level")
+
+
 # =========================================================================
 # Exception hierarchy
 # =========================================================================
 
 
 class TestExceptions(QRServiceTestCase):
+    _empty_err: QRServiceError
+    _not_found_err: Optional[QRServiceError]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Provoke the empty-data 400 and unknown-id 404 once each; the
+        # contract tests below all inspect the same raised exceptions
+        # instead of re-issuing identical requests per assertion.
+        super().setUpClass()
+        try:
+            cls.qr.generate("")
+        except QRServiceError as e:
+            cls._empty_err = e
+        cls._not_found_err = _provoked_not_found()
+
     def test_validation_error_inherits(self):
         self.assertTrue(issubclass(ValidationError, QRServiceError))
 
@@ -1022,38 +1290,25 @@ class TestExceptions(QRServiceTestCase):
         self.assertTrue(issubclass(ServerError, QRServiceError))
 
     def test_exception_has_status_code(self):
-        try:
-            self.qr.generate("")
-        except QRServiceError as e:
-            self.assertEqual(e.status_code, 400)
-            self.assertIsNotNone(e.body)
+        self.assertEqual(self._empty_err.status_code, 400)
+        self.assertIsNotNone(self._empty_err.body)
 
     def test_exception_has_body(self):
-        try:
-            self.qr.generate("")
-        except QRServiceError as e:
-            self.assertIsInstance(e.body, dict)
-            self.assertIn("error", e.body)
+        self.assertIsInstance(self._empty_err.body, dict)
+        self.assertIn("error", self._empty_err.body)
 
     def test_not_found_status_code(self):
-        try:
-            self.qr.tracked_stats("nonexistent", "fake")
-        except NotFoundError as e:
-            self.assertEqual(e.status_code, 404)
+        self.assertIsInstance(self._not_found_err, NotFoundError)
+        self.assertEqual(self._not_found_err.status_code, 404)
 
     def test_validation_error_message(self):
-        try:
-            self.qr.generate("")
-        except ValidationError as e:
-            self.assertTrue(len(str(e)) > 0)
+        self.assertIsInstance(self._empty_err, ValidationError)
+        self.assertTrue(len(str(self._empty_err)) > 0)
 
     def test_exception_str_representation(self):
         """QRServiceError should have a meaningful string representation."""
-        try:
-            self.qr.generate("")
-        except QRServiceError as e:
-            self.assertIsInstance(str(e), str)
-            self.assertTrue(len(str(e)) > 0)
+        self.assertIsInstance(str(self._empty_err), str)
+        self.assertTrue(len(str(self._empty_err)) > 0)
 
 
 # =========================================================================
@@ -1062,63 +1317,89 @@ class TestExceptions(QRServiceTestCase):
 
 
 class TestEdgeCases(QRServiceTestCase):
+    """Awkward payloads that should encode (and decode back) cleanly.
+
+    All payloads go up in one batch call and come back down through
+    concurrent decodes in setUpClass — 2 round-trips instead of 22 —
+    with each test asserting on its precomputed item. test_unicode_data
+    stays a true serial generate→decode pass so one edge case still
+    exercises the end-to-end path per run.
+    """
+
+    # "A" * 500 generates fine but is too dense for the server's decoder
+    # (/qr/decode 400s on it), so it's excluded from the decode pass and
+    # asserted on generation only, as before this class was batched.
+    _DECODE_SKIP = frozenset({"long"})
+
+    _PAYLOADS = {
+        "long": "A" * 500,
+        "url_special": "https://example.com/path?key=val&foo=bar#section",
+        "newlines": "line1\nline2\nline3",
+        "whitespace": "   ",
+        "single_char": "X",
+        "numeric": "1234567890",
+        "special_chars": "!@#$%^&*()_+-=[]{}|;':\",./<>?",
+        "email": "mailto:test@example.com?subject=Hello",
+        "multiline": "Name: Alice\nPhone: +1234\nEmail: a@b.com\nNote: Test",
+        "json": json.dumps({"key": "value", "nested": {"a": 1}}),
+    }
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        keys = list(cls._PAYLOADS)
+        items = cls.qr.batch(
+            [{"data": cls._PAYLOADS[k]} for k in keys]
+        )["items"]
+        cls._items = dict(zip(keys, items))
+        decode_keys = [k for k in keys if k not in cls._DECODE_SKIP]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            decoded = ex.map(
+                lambda k: _decode_data(cls.qr.image_bytes(cls._items[k])),
+                decode_keys,
+            )
+            cls._decoded = dict(zip(decode_keys, decoded))
+
+    def _assert_roundtrip(self, key: str) -> None:
+        self.assertIsNotNone(self._items[key]["image_base64"])
+        self.assertEqual(self._decoded[key], self._PAYLOADS[key])
+
     def test_long_data(self):
         """QR codes can encode surprisingly long strings."""
-        long_text = "A" * 500
-        result = self.qr.generate(long_text)
-        self.assertIsNotNone(result["image_base64"])
+        self.assertIsNotNone(self._items["long"]["image_base64"])
 
     def test_unicode_data(self):
         result = self.qr.generate("こんにちは世界 🌍")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "こんにちは世界 🌍")
+        self.assertEqual(_decode_data(self.qr.image_bytes(result)), "こんにちは世界 🌍")
 
     def test_url_special_chars(self):
-        result = self.qr.generate("https://example.com/path?key=val&foo=bar#section")
-        self.assertIsNotNone(result["image_base64"])
+        self._assert_roundtrip("url_special")
 
     def test_newlines_in_data(self):
-        result = self.qr.generate("line1\nline2\nline3")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "line1\nline2\nline3")
+        self._assert_roundtrip("newlines")
 
     def test_whitespace_only(self):
-        result = self.qr.generate("   ")
-        self.assertIsNotNone(result["image_base64"])
+        self._assert_roundtrip("whitespace")
 
     def test_single_char(self):
-        result = self.qr.generate("X")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "X")
+        self._assert_roundtrip("single_char")
 
     def test_numeric_string(self):
-        result = self.qr.generate("1234567890")
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], "1234567890")
+        self._assert_roundtrip("numeric")
 
     def test_special_chars_roundtrip(self):
-        data = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
-        result = self.qr.generate(data)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], data)
+        self._assert_roundtrip("special_chars")
 
     def test_email_format(self):
-        data = "mailto:test@example.com?subject=Hello"
-        result = self.qr.generate(data)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], data)
+        self._assert_roundtrip("email")
 
     def test_multiline_text(self):
-        data = "Name: Alice\nPhone: +1234\nEmail: a@b.com\nNote: Test"
-        result = self.qr.generate(data)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(decoded["data"], data)
+        self._assert_roundtrip("multiline")
 
     def test_json_payload(self):
-        data = json.dumps({"key": "value", "nested": {"a": 1}})
-        result = self.qr.generate(data)
-        decoded = self.qr.decode(self.qr.image_bytes(result))
-        self.assertEqual(json.loads(decoded["data"]), json.loads(data))
+        # The decoded payload is byte-for-byte what was encoded — compare
+        # the canonical strings directly instead of re-parsing both sides.
+        self._assert_roundtrip("json")
 
 
 # =========================================================================
@@ -1146,12 +1427,19 @@ class TestCrossFeature(QRServiceTestCase):
         self.assertNotEqual(regular["data"], tracked["qr"].get("data", ""))
 
     def test_all_formats_tracked(self):
-        """Create tracked QRs in all 3 formats."""
-        for fmt in ("png", "svg", "pdf"):
-            result = self._track(
-                self.qr.create_tracked(f"https://{fmt}.example.com", format=fmt)
-            )
-            self.assertIsNotNone(result["qr"]["image_base64"])
+        """Create tracked QRs in all 3 formats, concurrently."""
+        formats = ("png", "svg", "pdf")
+        with ThreadPoolExecutor(max_workers=len(formats)) as ex:
+            results = list(ex.map(
+                lambda fmt: self.qr.create_tracked(
+                    f"https://{fmt}.example.com", format=fmt,
+                ),
+                formats,
+            ))
+        for fmt, result in zip(formats, results):
+            with self.subTest(format=fmt):
+                self._track(result)
+                self.assertIsNotNone(result["qr"]["image_base64"])
 
     def test_tracked_with_custom_style_and_colors(self):
         result = self._track(
@@ -1169,24 +1457,24 @@ class TestCrossFeature(QRServiceTestCase):
         """Batch with PNG items, decode each — verify ordering."""
         items = [{"data": f"xf-{i}", "format": "png"} for i in range(3)]
         result = self.qr.batch(items)
-        for i, item in enumerate(result["items"]):
-            decoded = self.qr.decode(self.qr.image_bytes(item))
-            self.assertEqual(decoded["data"], f"xf-{i}")
+        # Pipeline the decode RPCs instead of sequencing three round-trips;
+        # executor.map preserves input order for the assertions.
+        with ThreadPoolExecutor(max_workers=len(items)) as ex:
+            decoded = list(
+                ex.map(lambda it: self.qr.decode(self.qr.image_bytes(it)),
+                       result["items"])
+            )
+        for i, d in enumerate(decoded):
+            self.assertEqual(d["data"], f"xf-{i}")
 
     def test_save_and_decode_cycle(self):
         """Generate → save → load → decode → verify."""
         content = "save-decode-cycle"
         result = self.qr.generate(content)
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
-        try:
-            self.qr.save_qr(result, path)
-            with open(path, "rb") as f:
-                raw = f.read()
-            decoded = self.qr.decode(raw)
-            self.assertEqual(decoded["data"], content)
-        finally:
-            os.unlink(path)
+        buf = io.BytesIO()
+        self.qr.save_qr(result, buf)
+        decoded = self.qr.decode(buf.getvalue())
+        self.assertEqual(decoded["data"], content)
 
     def test_template_and_generate_same_data(self):
         """WiFi template and manual generation with same data should produce same QR content."""
@@ -1196,9 +1484,10 @@ class TestCrossFeature(QRServiceTestCase):
         # Manually generate with same data
         manual_result = self.qr.generate(wifi_data)
         # Decode both — should match
-        d1 = self.qr.decode(self.qr.image_bytes(wifi_result))
-        d2 = self.qr.decode(self.qr.image_bytes(manual_result))
-        self.assertEqual(d1["data"], d2["data"])
+        self.assertEqual(
+            self._roundtrip_data(wifi_result),
+            self._roundtrip_data(manual_result),
+        )
 
     def test_vcard_batch(self):
         """Generate vCard data and use it in batch — verify generation succeeds."""
@@ -1215,6 +1504,44 @@ class TestCrossFeature(QRServiceTestCase):
         self.assertIn("Batch Person", decoded["data"])
 
 
+# =========================================================================
+# Async client
+# =========================================================================
+
+
+@unittest.skipUnless(aiohttp is not None, "aiohttp not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def test_generate(self):
+        async with AsyncQRService(BASE_URL) as qr:
+            result = await qr.generate("async test")
+            self.assertEqual(result["data"], "async test")
+            self.assertTrue(result["image_base64"].startswith(_PNG_DATA_URI))
+
+    async def test_generate_all_concurrent(self):
+        async with AsyncQRService(BASE_URL) as qr:
+            results = await qr.generate_all([f"async-{i}" for i in range(5)])
+            self.assertEqual([r["data"] for r in results],
+                             [f"async-{i}" for i in range(5)])
+
+    async def test_batch(self):
+        async with AsyncQRService(BASE_URL) as qr:
+            result = await qr.batch([{"data": "async-a"}, {"data": "async-b"}])
+            self.assertEqual(result["total"], 2)
+
+    async def test_validation_error(self):
+        async with AsyncQRService(BASE_URL) as qr:
+            with self.assertRaises(ValidationError):
+                await qr.generate("")
+
+    async def test_tracked_lifecycle(self):
+        async with AsyncQRService(BASE_URL) as qr:
+            created = await qr.create_tracked("https://async.example.com")
+            stats = await qr.tracked_stats(created["id"], created["manage_token"])
+            self.assertEqual(stats["scan_count"], 0)
+            deleted = await qr.delete_tracked(created["id"], created["manage_token"])
+            self.assertTrue(deleted["deleted"])
+
+
 # =========================================================================
 # Error response structure
 # =========================================================================
@@ -1231,10 +1558,10 @@ class TestErrorResponses(QRServiceTestCase):
             self.assertIn("error", e.body)
 
     def test_404_has_error_info(self):
-        try:
-            self.qr.tracked_stats("nonexistent", "fake")
-        except NotFoundError as e:
-            self.assertEqual(e.status_code, 404)
+        err = _provoked_not_found()
+        self.assertIsInstance(err, NotFoundError)
+        self.assertEqual(err.status_code, 404)
+        self.assertIsNotNone(err.body)
 
     def test_invalid_format_error_message(self):
         try:
@@ -1250,7 +1577,55 @@ class TestErrorResponses(QRServiceTestCase):
             self.assertIsNotNone(e.body)
 
 
+def _parallel_main() -> None:
+    """Run each TestCase class in its own worker thread.
+
+    Every test here is an independent HTTP round-trip, so the suite is
+    network-bound; dispatching per-class suites concurrently cuts wall time
+    roughly in proportion to the connections the server accepts. Methods
+    within a class still run serially (TestGenerateDeterminism relies on
+    that), and all classes share the module-level client's pool.
+    """
+    import concurrent.futures
+
+    loader = unittest.TestLoader()
+    suites = [s for s in loader.loadTestsFromModule(sys.modules[__name__])
+              if s.countTestCases()]
+
+    def run(suite: unittest.TestSuite) -> unittest.TestResult:
+        result = unittest.TestResult()
+        suite.run(result)
+        return result
+
+    workers = int(os.environ.get("QR_TEST_WORKERS", "8"))
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, suites))
+    elapsed = time.monotonic() - start
+
+    ran = sum(r.testsRun for r in results)
+    skipped = sum(len(r.skipped) for r in results)
+    problems = [(t, tb) for r in results for t, tb in r.failures + r.errors]
+    for test, tb in problems:
+        print("=" * 70)
+        print(f"FAIL: {test}")
+        print("-" * 70)
+        print(tb)
+    print("-" * 70)
+    print(f"Ran {ran} tests in {elapsed:.3f}s")
+    print()
+    if problems:
+        print(f"FAILED (failures={len(problems)})")
+        sys.exit(1)
+    print(f"OK (skipped={skipped})" if skipped else "OK")
+
+
 if __name__ == "__main__":
     print(f"\n🔲 QR Service Python SDK Tests")
     print(f"   Server: {BASE_URL}\n")
-    unittest.main(verbosity=2)
+    if len(sys.argv) > 1 or os.environ.get("QR_TEST_SERIAL"):
+        # Any CLI args (-v, test selection) or QR_TEST_SERIAL=1 fall back to
+        # the stock serial runner.
+        unittest.main(verbosity=2)
+    else:
+        _parallel_main()